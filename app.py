@@ -1,7 +1,11 @@
+from functools import lru_cache
 from pathlib import Path
 import importlib
+import os
 
+import orjson
 from flask import Flask, jsonify, render_template, request
+from flask.json.provider import DefaultJSONProvider
 _cors_spec = importlib.util.find_spec("flask_cors")
 if _cors_spec:
     CORS = importlib.import_module("flask_cors").CORS
@@ -9,11 +13,21 @@ else:
     def CORS(_app):
         return _app
 
-from src.agents.orchestrator_agent import OrchestratorAgent
 from src.memory.layered_memory import layered_memory_store
 
+class OrjsonProvider(DefaultJSONProvider):
+    """使用orjson序列化接口响应：中文原样输出，键保持插入顺序。"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # 初始化Flask应用
 app = Flask(__name__, template_folder="templates")
+app.json = OrjsonProvider(app)
 CORS(app)
 
 @app.route("/")
@@ -51,11 +65,27 @@ def _build_runtime_config(request_data: dict) -> dict:
             },
         },
         "entrez_email": pubmed_config.get("email", "").strip(),
+        # 可选：NCBI API Key，未填写时读取环境变量 NCBI_API_KEY
+        "entrez_api_key": (pubmed_config.get("api_key") or "").strip() or os.getenv("NCBI_API_KEY") or None,
     }
 
 
-def _get_orchestrator(config: dict) -> OrchestratorAgent:
-    return OrchestratorAgent(config)
+@lru_cache(maxsize=1)
+def _load_orchestrator_class():
+    # Agent链依赖langchain_openai、fastmcp、pandas等，导入耗时数秒；推迟到首次请求（或gunicorn post_fork预热）
+    from src.agents.orchestrator_agent import OrchestratorAgent
+    return OrchestratorAgent
+
+
+@lru_cache(maxsize=32)
+def _build_orchestrator(config_key: str):
+    return _load_orchestrator_class()(orjson.loads(config_key))
+
+
+def _get_orchestrator(config: dict):
+    # 编排器及各Agent的LLM客户端、提示词模板与请求内容无关，相同运行时配置直接复用
+    config_key = orjson.dumps(config, option=orjson.OPT_SORT_KEYS).decode()
+    return _build_orchestrator(config_key)
 
 
 def _validate_runtime_config(config: dict):
@@ -194,5 +224,6 @@ def get_report(report_id: str):
 
 
 if __name__ == "__main__":
-    # 启动Flask服务（调试模式，生产环境需关闭）
-    app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
+    # 本地开发服务器；生产环境使用 gunicorn -c gunicorn.conf.py app:app
+    # 设置 FLASK_DEV=1 开启调试模式（自动重载）
+    app.run(host="0.0.0.0", port=5000, debug=bool(os.getenv("FLASK_DEV")))
\ No newline at end of file
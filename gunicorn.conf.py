@@ -0,0 +1,24 @@
+import os
+import threading
+
+# 生产部署：gunicorn -c gunicorn.conf.py app:app
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+
+# /api/chat 绝大部分时间在等待LLM与PubMed网络I/O，使用线程worker即可并发处理请求。
+# 会话、引用与L1/L2记忆保存在进程内存中，多worker时同一会话的请求可能落到不同进程，
+# 因此默认单worker；如需多worker，请在负载均衡层配置会话粘滞。
+worker_class = "gthread"
+workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# 检索+报告生成可能持续数分钟
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "300"))
+
+
+def post_fork(server, worker):
+    # worker启动后在后台线程预先导入Agent链，避免首个请求承担数秒的导入耗时
+    def _warm_up():
+        from app import _load_orchestrator_class
+        _load_orchestrator_class()
+
+    threading.Thread(target=_warm_up, name="agent-import-warmup", daemon=True).start()
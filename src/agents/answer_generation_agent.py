@@ -112,21 +112,20 @@ class AnswerGenerationAgent:
 
         return re.sub(r"\[(\d+(?:\s*,\s*\d+)*)\]", _replace, answer)
 
-    def generate(
+    def _build_prompt(
         self,
         user_query: str,
         recent_dialogue: str,
         intent: Dict[str, Any],
         l2_records: List[Dict[str, Any]],
         rag_chunks: List[Dict[str, Any]],
-        papers: List[Dict[str, Any]],
-    ) -> Tuple[str, Dict[str, Dict[str, Any]]]:
-        citations = self._build_citations(papers=papers, rag_chunks=rag_chunks)
+        citations: Dict[str, Dict[str, Any]],
+    ) -> str:
         citation_context = self._build_citation_context(citations)
 
         l2_text = json.dumps(l2_records, ensure_ascii=False)
         rag_text = json.dumps(rag_chunks, ensure_ascii=False)
-        prompt = f"""
+        return f"""
                 你是一个专业的医学文献助手。请基于以下信息回答问题。
 
                 ## 意图信息
@@ -153,6 +152,18 @@ class AnswerGenerationAgent:
                 3. 只能使用已有编号，不得虚构。
                 4. 证据不足时明确说明。
                 """
+
+    def generate(
+        self,
+        user_query: str,
+        recent_dialogue: str,
+        intent: Dict[str, Any],
+        l2_records: List[Dict[str, Any]],
+        rag_chunks: List[Dict[str, Any]],
+        papers: List[Dict[str, Any]],
+    ) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+        citations = self._build_citations(papers=papers, rag_chunks=rag_chunks)
+        prompt = self._build_prompt(user_query, recent_dialogue, intent, l2_records, rag_chunks, citations)
         try:
             answer = self.llm.invoke(prompt).content
         except Exception:
@@ -160,3 +171,22 @@ class AnswerGenerationAgent:
 
         answer = self._validate_citation_marks(answer, citations)
         return answer, citations
+
+    async def agenerate(
+        self,
+        user_query: str,
+        recent_dialogue: str,
+        intent: Dict[str, Any],
+        l2_records: List[Dict[str, Any]],
+        rag_chunks: List[Dict[str, Any]],
+        papers: List[Dict[str, Any]],
+    ) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+        citations = self._build_citations(papers=papers, rag_chunks=rag_chunks)
+        prompt = self._build_prompt(user_query, recent_dialogue, intent, l2_records, rag_chunks, citations)
+        try:
+            answer = (await self.llm.ainvoke(prompt)).content
+        except Exception:
+            answer = "当前根据已缓存记忆给出回答；如需更强证据，请触发新的文献检索。"
+
+        answer = self._validate_citation_marks(answer, citations)
+        return answer, citations
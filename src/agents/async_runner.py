@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+class BackgroundEventLoop:
+    """常驻后台事件循环：同步入口统一在同一个loop上执行协程。
+
+    langchain_openai 会在进程内缓存异步HTTP客户端，若每次请求都 asyncio.run 新建loop，
+    连接池会绑定到已关闭的loop上；这里复用单个loop，并允许多个Flask线程并发提交协程。
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            # fork 之后线程不会被继承，需要在子进程中重新拉起
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="agent-event-loop", daemon=True)
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("不能在后台事件循环线程内同步等待协程，请直接 await 对应的异步方法")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+background_loop = BackgroundEventLoop()
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    return background_loop.run(coro)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-import json
 from typing import Any, Dict
 
+import orjson
+
+from src.agents.async_runner import run_sync
+from src.agents.json_fence import strip_json_fence
 from src.mcp.client import MCPToolClient
 
 
@@ -14,22 +17,19 @@ class DataAgent:
         self.llm = llm
         self.mcp_client = MCPToolClient()
 
-    def run(self, papers_data: str | Dict[str, Any]) -> Dict[str, Any]:
+    async def arun(self, papers_data: str | Dict[str, Any]) -> Dict[str, Any]:
         try:
             if isinstance(papers_data, dict):
                 payload = papers_data
             else:
-                cleaned = papers_data.strip()
-                if cleaned.startswith("```"):
-                    cleaned = cleaned.split("```")[1].replace("json", "").strip()
-                payload = json.loads(cleaned)
+                payload = orjson.loads(strip_json_fence(papers_data))
 
             data = payload.get("data", payload if isinstance(payload, list) else [])
             if not isinstance(data, list):
                 data = []
 
             data_cfg = self.config.get("agent", {}).get("data", {})
-            return self.mcp_client.process_data(
+            return await self.mcp_client.aprocess_data(
                 papers_data=data,
                 analysis_type="stat",
                 plot_format=data_cfg.get("plot_format", "png"),
@@ -42,3 +42,6 @@ class DataAgent:
                 "statistic": {},
                 "plot_paths": [],
             }
+
+    def run(self, papers_data: str | Dict[str, Any]) -> Dict[str, Any]:
+        return run_sync(self.arun(papers_data))
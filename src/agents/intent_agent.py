@@ -4,6 +4,8 @@ import json
 import re
 from typing import Any, Dict
 
+from src.agents.json_fence import strip_json_fence
+
 
 class IntentAgent:
     def __init__(self, llm):
@@ -80,12 +82,8 @@ class IntentAgent:
     def _fallback(self, user_message: str, has_cached_papers: bool) -> Dict[str, Any]:
         return self._rule_based(user_message=user_message, has_cached_papers=has_cached_papers)
 
-    def classify(self, user_message: str, recent_context: str, has_cached_papers: bool) -> Dict[str, Any]:
-        rule_result = self._rule_based(user_message=user_message, has_cached_papers=has_cached_papers)
-        if rule_result["intent"] in {"memory", "literature"}:
-            return rule_result
-
-        prompt = f"""
+    def _build_prompt(self, user_message: str, recent_context: str) -> str:
+        return f"""
                     你是医学对话系统的意图识别器。请判断该问题是否必须触发新的PubMed检索。
 
                     【最近对话】
@@ -106,30 +104,46 @@ class IntentAgent:
                     2. 若问题询问治疗趋势、疗效证据、最新研究、对比方案等，need_retrieval=true。
                     3. 若已有缓存文献且问题可由缓存回答，need_retrieval=false。
                 """
+
+    def _parse_result(self, raw: str, user_message: str) -> Dict[str, Any]:
+        parsed = json.loads(strip_json_fence(raw))
+        intent = parsed.get("intent", "general")
+        need = bool(parsed.get("need_retrieval", False))
+        reason = parsed.get("reason", "")
+        if intent not in {"literature", "memory", "general"}:
+            intent = "general"
+        intent_type_map = {
+            "literature": "research_query",
+            "memory": "memory_query",
+            "general": "factual_query",
+        }
+        return {
+            "intent": intent,
+            "intent_type": intent_type_map.get(intent, "factual_query"),
+            "need_retrieval": need,
+            "can_use_memory": True,
+            "can_use_rag": intent != "memory",
+            "keywords": self._extract_keywords(user_message),
+            "expanded_queries": [],
+            "reason": reason,
+        }
+
+    def classify(self, user_message: str, recent_context: str, has_cached_papers: bool) -> Dict[str, Any]:
+        rule_result = self._rule_based(user_message=user_message, has_cached_papers=has_cached_papers)
+        if rule_result["intent"] in {"memory", "literature"}:
+            return rule_result
         try:
-            raw = self.llm.invoke(prompt).content.strip()
-            if raw.startswith("```"):
-                raw = raw.split("```")[1].replace("json", "").strip()
-            parsed = json.loads(raw)
-            intent = parsed.get("intent", "general")
-            need = bool(parsed.get("need_retrieval", False))
-            reason = parsed.get("reason", "")
-            if intent not in {"literature", "memory", "general"}:
-                intent = "general"
-            intent_type_map = {
-                "literature": "research_query",
-                "memory": "memory_query",
-                "general": "factual_query",
-            }
-            return {
-                "intent": intent,
-                "intent_type": intent_type_map.get(intent, "factual_query"),
-                "need_retrieval": need,
-                "can_use_memory": True,
-                "can_use_rag": intent != "memory",
-                "keywords": self._extract_keywords(user_message),
-                "expanded_queries": [],
-                "reason": reason,
-            }
+            raw = self.llm.invoke(self._build_prompt(user_message, recent_context)).content
+            return self._parse_result(raw, user_message)
+        except Exception:
+            return rule_result
+
+    async def aclassify(self, user_message: str, recent_context: str, has_cached_papers: bool) -> Dict[str, Any]:
+        rule_result = self._rule_based(user_message=user_message, has_cached_papers=has_cached_papers)
+        if rule_result["intent"] in {"memory", "literature"}:
+            return rule_result
+        try:
+            raw = (await self.llm.ainvoke(self._build_prompt(user_message, recent_context))).content
+            return self._parse_result(raw, user_message)
         except Exception:
             return rule_result
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import re
+
+# LLM输出可能被Markdown代码块包裹（```json ... ```），一次匹配取出其中内容
+_JSON_FENCE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```|$)", re.DOTALL | re.IGNORECASE)
+
+
+def strip_json_fence(text: str) -> str:
+    match = _JSON_FENCE.match(text or "")
+    return match.group(1) if match else (text or "").strip()
@@ -1,14 +1,44 @@
 from __future__ import annotations
 
-import json
 import math
 import re
+from functools import lru_cache
 from typing import Any, Dict
 
+import orjson
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
+from src.agents.async_runner import run_sync
+from src.agents.json_fence import strip_json_fence
+from src.cache.llm_cache import CachingChatModel
 from src.mcp.client import MCPToolClient
 
+# 研究方法分类：每类关键词合并为一个预编译正则（一次扫描），按元组顺序体现分类优先级
+_METHOD_PATTERNS = tuple(
+    (label, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for label, keywords in (
+        ("RCT研究", ("rct", "randomized controlled trial", "随机对照试验")),
+        ("队列研究", ("cohort", "队列", "前瞻性", "回顾性队列")),
+        ("病例对照研究", ("case-control", "病例对照")),
+        ("横断面研究", ("cross-sectional", "横断面", "现况调查")),
+        ("病例报告", ("case report", "病例报告", "个案报告")),
+    )
+)
+
+_STANDARDIZE_SYSTEM_PROMPT = """你是医学文献结构化助手。请对输入文献做标准化，输出中文分条总结并完成方法学分类。
+
+【输出要求】
+1. 严格输出JSON数组，每个元素包含字段：
+- index: int（与输入一致）
+- background_points_zh: string[]（研究背景中文分条，2-3条）
+- methods_points_zh: string[]（研究方法中文分条，2-3条）
+- conclusion_points_zh: string[]（研究结论中文分条，2-3条）
+- limitation_points_zh: string[]（局限性中文分条，1-2条）
+- methods_classified: string（仅可选：RCT研究/队列研究/病例对照研究/横断面研究/病例报告/系统综述与Meta分析/其他研究）
+2. 输入中若是英文，必须翻译为中文后再概括。
+3. 不要输出任何解释性文本，不要使用Markdown代码块。"""
+
 
 class LiteratureAgent:
     """LangChain 1.0 兼容实现：通过MCP client调用工具并做轻量结构化处理。"""
@@ -22,42 +52,31 @@ class LiteratureAgent:
         llm_config = self.config["llm"]
         if llm_config["type"] != "tongyi":
             raise ValueError("当前LiteratureAgent仅支持tongyi配置")
-        return ChatOpenAI(
-            model=llm_config["tongyi"]["model_name"],
-            api_key=llm_config["tongyi"]["api_key"],
-            base_url=llm_config["tongyi"]["base_url"],
-            temperature=0.1,
+        return CachingChatModel(
+            ChatOpenAI(
+                model=llm_config["tongyi"]["model_name"],
+                api_key=llm_config["tongyi"]["api_key"],
+                base_url=llm_config["tongyi"]["base_url"],
+                temperature=0.1,
+            )
         )
 
-    def _classify_research_method(self, method_text: str) -> str:
-        text = (method_text or "").lower()
-        if any(keyword in text for keyword in ["rct", "randomized controlled trial", "随机对照试验"]):
-            return "RCT研究"
-        if any(keyword in text for keyword in ["cohort", "队列", "前瞻性", "回顾性队列"]):
-            return "队列研究"
-        if any(keyword in text for keyword in ["case-control", "病例对照"]):
-            return "病例对照研究"
-        if any(keyword in text for keyword in ["cross-sectional", "横断面", "现况调查"]):
-            return "横断面研究"
-        if any(keyword in text for keyword in ["case report", "病例报告", "个案报告"]):
-            return "病例报告"
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify_research_method(method_text: str) -> str:
+        text = method_text or ""
+        for label, pattern in _METHOD_PATTERNS:
+            if pattern.search(text):
+                return label
         return "其他研究"
 
-    def _strip_json_fence(self, text: str) -> str:
-        cleaned = (text or "").strip()
-        if cleaned.startswith("```"):
-            parts = cleaned.split("```")
-            if len(parts) >= 2:
-                cleaned = parts[1].replace("json", "").strip()
-        return cleaned
-
     def _format_bullets(self, items: list[str]) -> str:
         valid = [item.strip() for item in items if isinstance(item, str) and item.strip()]
         if not valid:
             return "- 未明确提及"
         return "\n".join([f"- {item}" for item in valid])
 
-    def _llm_standardize_papers(self, papers: list[dict]) -> list[dict]:
+    async def _llm_standardize_papers(self, papers: list[dict]) -> list[dict]:
         if not papers:
             return papers
 
@@ -72,26 +91,14 @@ class LiteratureAgent:
                 }
             )
 
-        prompt = f"""
-                你是医学文献结构化助手。请对输入文献做标准化，输出中文分条总结并完成方法学分类。
-
-                【输入文献】
-                {json.dumps(payload, ensure_ascii=False)}
-
-                【输出要求】
-                1. 严格输出JSON数组，每个元素包含字段：
-                - index: int（与输入一致）
-                - background_points_zh: string[]（研究背景中文分条，2-3条）
-                - methods_points_zh: string[]（研究方法中文分条，2-3条）
-                - conclusion_points_zh: string[]（研究结论中文分条，2-3条）
-                - limitation_points_zh: string[]（局限性中文分条，1-2条）
-                - methods_classified: string（仅可选：RCT研究/队列研究/病例对照研究/横断面研究/病例报告/系统综述与Meta分析/其他研究）
-                2. 输入中若是英文，必须翻译为中文后再概括。
-                3. 不要输出任何解释性文本，不要使用Markdown代码块。
-                """
+        # 静态指令在前、文献数据在后，保持提示词前缀稳定以命中服务端前缀缓存
+        messages = [
+            SystemMessage(content=_STANDARDIZE_SYSTEM_PROMPT),
+            HumanMessage(content=f"【输入文献】\n{orjson.dumps(payload).decode()}"),
+        ]
         try:
-            raw = self.llm.invoke(prompt).content
-            parsed = json.loads(self._strip_json_fence(raw))
+            raw = (await self.llm.ainvoke(messages)).content
+            parsed = orjson.loads(strip_json_fence(raw))
             if not isinstance(parsed, list):
                 return papers
 
@@ -163,7 +170,7 @@ class LiteratureAgent:
             return papers[:max_papers]
         return selected[:max_papers]
 
-    def run(
+    async def arun(
         self,
         keywords: str,
         max_papers_override: int | None = None,
@@ -173,7 +180,7 @@ class LiteratureAgent:
     ) -> Dict[str, Any]:
         literature_cfg = self.config.get("agent", {}).get("literature", {})
         max_papers = int(max_papers_override or literature_cfg.get("max_papers", 10))
-        result = self.mcp_client.search_pubmed(
+        result = await self.mcp_client.asearch_pubmed(
             query=keywords,
             email=self.config.get("entrez_email", ""),
             max_papers=max_papers,
@@ -181,12 +188,13 @@ class LiteratureAgent:
             end_date=end_date if end_date is not None else literature_cfg.get("end_date"),
             retstart=0,
             sort=sort,
+            api_key=self.config.get("entrez_api_key"),
         )
         if result.get("status") not in {"success", "warning"}:
             return result
 
         papers = result.get("data", [])
-        papers = self._llm_standardize_papers(papers)
+        papers = await self._llm_standardize_papers(papers)
 
         for paper in papers:
             if not paper.get("methods_classified"):
@@ -204,3 +212,21 @@ class LiteratureAgent:
             "message": result.get("message", "检索完成"),
             "data": papers,
         }
+
+    def run(
+        self,
+        keywords: str,
+        max_papers_override: int | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        sort: str = "relevance",
+    ) -> Dict[str, Any]:
+        return run_sync(
+            self.arun(
+                keywords=keywords,
+                max_papers_override=max_papers_override,
+                start_date=start_date,
+                end_date=end_date,
+                sort=sort,
+            )
+        )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict, List
 
 from src.memory.layered_memory import layered_memory_store
@@ -38,3 +39,19 @@ class MemoryRetrievalAgent:
             "rag_similarity": rag_similarity,
             "should_use_pubmed": should_use_pubmed,
         }
+
+    async def aretrieve(
+        self,
+        session_id: str,
+        query: str,
+        intent: Dict[str, Any],
+        expanded_queries: List[str],
+    ) -> Dict[str, Any]:
+        # 向量检索为同步调用，放到线程池执行，避免阻塞共享事件循环
+        return await asyncio.to_thread(
+            self.retrieve,
+            session_id=session_id,
+            query=query,
+            intent=intent,
+            expanded_queries=expanded_queries,
+        )
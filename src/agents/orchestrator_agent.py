@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict, List
 
 from langchain_openai import ChatOpenAI
 
 from src.agents.answer_generation_agent import AnswerGenerationAgent
+from src.agents.async_runner import run_sync
 from src.agents.data_agent import DataAgent
 from src.agents.intent_agent import IntentAgent
 from src.agents.literature_agent import LiteratureAgent
@@ -23,8 +25,9 @@ class OrchestratorAgent:
         self.memory_agent = MemoryRetrievalAgent(rag_threshold=0.7)
         self.answer_agent = AnswerGenerationAgent(self.llm)
         self.literature_agent = LiteratureAgent(config)
-        self.data_agent = DataAgent(config, llm=self.llm)
-        self.report_agent = ReportAgent(config, self.llm)
+        # 数据/报告阶段复用文献Agent的低温度缓存模型，相同输入可直接命中历史响应
+        self.data_agent = DataAgent(config, llm=self.literature_agent.llm)
+        self.report_agent = ReportAgent(config, self.literature_agent.llm)
 
     def _init_llm(self):
         llm_config = self.config["llm"]
@@ -63,7 +66,7 @@ class OrchestratorAgent:
             papers.extend(record.get("papers", []))
         return papers
 
-    def _search_pubmed_with_expanded_queries(
+    async def _asearch_pubmed_with_expanded_queries(
         self,
         expanded_queries: List[str],
     ) -> Dict[str, Any]:
@@ -72,16 +75,23 @@ class OrchestratorAgent:
         end_date = self.config["agent"]["literature"].get("end_date")
         per_query_limit = max(1, max_papers // max(1, len(expanded_queries)))
 
+        # 各扩展检索式互不依赖，并发发起PubMed检索与LLM标准化
+        results = await asyncio.gather(
+            *[
+                self.literature_agent.arun(
+                    keywords=query,
+                    max_papers_override=per_query_limit,
+                    start_date=start_date,
+                    end_date=end_date,
+                    sort="relevance",
+                )
+                for query in expanded_queries
+            ]
+        )
+
         all_papers: List[Dict[str, Any]] = []
         query_status = []
-        for query in expanded_queries:
-            result = self.literature_agent.run(
-                keywords=query,
-                max_papers_override=per_query_limit,
-                start_date=start_date,
-                end_date=end_date,
-                sort="relevance",
-            )
+        for query, result in zip(expanded_queries, results):
             query_status.append(
                 {
                     "query": query,
@@ -116,15 +126,77 @@ class OrchestratorAgent:
         year_text = f"，时间覆盖约{min(years)}-{max(years)}" if years else ""
         return f"主题：{user_message}；检索到{len(papers)}篇文献{year_text}。"
 
-    def process_message(self, session_id: str | None, user_message: str) -> Dict[str, Any]:
+    def _save_report_to_memory(
+        self,
+        session_id: str,
+        user_message: str,
+        intent: Dict[str, Any],
+        papers: List[Dict[str, Any]],
+        report_result: Dict[str, Any],
+    ) -> None:
+        report_path = report_result["report_path"]
+        search_record = layered_memory_store.add_l2_search_record(
+            session_id=session_id,
+            topic=" ".join(intent.get("keywords", [])) or user_message,
+            query=user_message,
+            papers=papers,
+            summary=self._build_search_summary(papers, user_message),
+            markdown_path=report_path,
+        )
+        layered_memory_store.register_report(report_path)
+        layered_memory_store.add_report_to_l3(
+            report_content=report_result.get("report_content", ""),
+            report_path=report_path,
+            topic=search_record.topic,
+            search_id=search_record.search_id,
+            session_id=session_id,
+            papers=papers,
+        )
+
+    async def _arun_report_pipeline(
+        self,
+        session_id: str,
+        user_message: str,
+        intent: Dict[str, Any],
+        lit_result: Dict[str, Any],
+        papers: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        data_result = await self.data_agent.arun({"data": papers})
+        report_result = await self.report_agent.arun(
+            keywords=user_message,
+            literature_data={"status": lit_result.get("status", "success"), "data": papers},
+            data_process_data=data_result,
+        )
+
+        report_path = report_result.get("report_path", "")
+        if report_path:
+            # 记忆写入包含同步的向量库操作，放到线程池执行，避免阻塞共享事件循环
+            await asyncio.to_thread(
+                self._save_report_to_memory,
+                session_id=session_id,
+                user_message=user_message,
+                intent=intent,
+                papers=papers,
+                report_result=report_result,
+            )
+        return report_result
+
+    async def aprocess_message(self, session_id: str | None, user_message: str) -> Dict[str, Any]:
         session = layered_memory_store.get_or_create_session(session_id)
         session_id = session.session_id
 
         layered_memory_store.add_message(session_id=session_id, role="human", content=user_message)
         recent_dialogue = layered_memory_store.get_recent_dialogue_text(session_id=session_id, limit=10)
 
-        has_cached = bool(layered_memory_store.search_l2_records(session_id=session_id, query=user_message, top_k=1))
-        intent = self.intent_agent.classify(
+        has_cached = bool(
+            await asyncio.to_thread(
+                layered_memory_store.search_l2_records,
+                session_id=session_id,
+                query=user_message,
+                top_k=1,
+            )
+        )
+        intent = await self.intent_agent.aclassify(
             user_message=user_message,
             recent_context=recent_dialogue,
             has_cached_papers=has_cached,
@@ -132,14 +204,14 @@ class OrchestratorAgent:
 
         expanded_queries = []
         if intent.get("need_retrieval", False):
-            expanded_queries = self.query_expansion_agent.expand(
+            expanded_queries = await self.query_expansion_agent.aexpand(
                 user_message=user_message,
                 recent_context=recent_dialogue,
                 max_queries=5,
             )
         intent["expanded_queries"] = expanded_queries
 
-        memory_result = self.memory_agent.retrieve(
+        memory_result = await self.memory_agent.aretrieve(
             session_id=session_id,
             query=user_message,
             intent=intent,
@@ -155,39 +227,13 @@ class OrchestratorAgent:
         }
 
         papers = self._collect_papers_from_memory(memory_result)
+        lit_result: Dict[str, Any] | None = None
         if memory_result.get("should_use_pubmed", False):
             search_performed = True
-            lit_result = self._search_pubmed_with_expanded_queries(expanded_queries=expanded_queries)
+            lit_result = await self._asearch_pubmed_with_expanded_queries(expanded_queries=expanded_queries)
             papers = lit_result.get("data", [])
 
-            data_result = self.data_agent.run({"data": papers})
-            report_result = self.report_agent.run(
-                keywords=user_message,
-                literature_data={"status": lit_result.get("status", "success"), "data": papers},
-                data_process_data=data_result,
-            )
-
-            report_path = report_result.get("report_path", "")
-            if report_path:
-                search_record = layered_memory_store.add_l2_search_record(
-                    session_id=session_id,
-                    topic=" ".join(intent.get("keywords", [])) or user_message,
-                    query=user_message,
-                    papers=papers,
-                    summary=self._build_search_summary(papers, user_message),
-                    markdown_path=report_path,
-                )
-                layered_memory_store.register_report(report_path)
-                layered_memory_store.add_report_to_l3(
-                    report_content=report_result.get("report_content", ""),
-                    report_path=report_path,
-                    topic=search_record.topic,
-                    search_id=search_record.search_id,
-                    session_id=session_id,
-                    papers=papers,
-                )
-
-        answer, citations = self.answer_agent.generate(
+        answer_coro = self.answer_agent.agenerate(
             user_query=user_message,
             recent_dialogue=recent_dialogue,
             intent=intent,
@@ -195,6 +241,20 @@ class OrchestratorAgent:
             rag_chunks=memory_result.get("from_rag", []),
             papers=papers,
         )
+        if lit_result is not None:
+            # 回答只依赖检索到的文献，与「数据统计→报告生成→记忆写入」链路并发执行
+            report_result, (answer, citations) = await asyncio.gather(
+                self._arun_report_pipeline(
+                    session_id=session_id,
+                    user_message=user_message,
+                    intent=intent,
+                    lit_result=lit_result,
+                    papers=papers,
+                ),
+                answer_coro,
+            )
+        else:
+            answer, citations = await answer_coro
 
         citations = layered_memory_store.register_citations(session_id=session_id, citations=citations)
 
@@ -213,3 +273,6 @@ class OrchestratorAgent:
                 "l3_vector_backend": layered_memory_store.get_l3_backend(),
             },
         }
+
+    def process_message(self, session_id: str | None, user_message: str) -> Dict[str, Any]:
+        return run_sync(self.aprocess_message(session_id=session_id, user_message=user_message))
@@ -3,13 +3,15 @@ from __future__ import annotations
 import json
 from typing import List
 
+from src.agents.json_fence import strip_json_fence
+
 
 class QueryExpansionAgent:
     def __init__(self, llm):
         self.llm = llm
 
-    def expand(self, user_message: str, recent_context: str, max_queries: int = 4) -> List[str]:
-        prompt = f"""
+    def _build_prompt(self, user_message: str, recent_context: str, max_queries: int) -> str:
+        return f"""
                 将用户医学问题扩展为适合PubMed的多样英文检索短语，避免同质化。
 
                 【最近对话】
@@ -24,19 +26,29 @@ class QueryExpansionAgent:
                 3. 避免完全同义重复。
                 4. 严格输出JSON：{{"queries": ["...", "..."]}}
                 """
+
+    def _parse_queries(self, raw: str, user_message: str, max_queries: int) -> List[str]:
+        parsed = json.loads(strip_json_fence(raw))
+        queries = [q.strip() for q in parsed.get("queries", []) if isinstance(q, str) and q.strip()]
+        deduped = []
+        seen = set()
+        for query in queries:
+            key = query.lower()
+            if key not in seen:
+                seen.add(key)
+                deduped.append(query)
+        return deduped[:max_queries] if deduped else [user_message]
+
+    def expand(self, user_message: str, recent_context: str, max_queries: int = 4) -> List[str]:
+        try:
+            raw = self.llm.invoke(self._build_prompt(user_message, recent_context, max_queries)).content
+            return self._parse_queries(raw, user_message, max_queries)
+        except Exception:
+            return [user_message]
+
+    async def aexpand(self, user_message: str, recent_context: str, max_queries: int = 4) -> List[str]:
         try:
-            raw = self.llm.invoke(prompt).content.strip()
-            if raw.startswith("```"):
-                raw = raw.split("```")[1].replace("json", "").strip()
-            parsed = json.loads(raw)
-            queries = [q.strip() for q in parsed.get("queries", []) if isinstance(q, str) and q.strip()]
-            deduped = []
-            seen = set()
-            for query in queries:
-                key = query.lower()
-                if key not in seen:
-                    seen.add(key)
-                    deduped.append(query)
-            return deduped[:max_queries] if deduped else [user_message]
+            raw = (await self.llm.ainvoke(self._build_prompt(user_message, recent_context, max_queries))).content
+            return self._parse_queries(raw, user_message, max_queries)
         except Exception:
             return [user_message]
@@ -1,16 +1,20 @@
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-import json
+import orjson
 from typing import Dict, Any
 import os
-from src.callbacks.log_handler import AgentLogHandler
+from src.agents.async_runner import run_sync
+from src.agents.json_fence import strip_json_fence
 from datetime import datetime
+from uuid import uuid4
+
+# 报告提示词中的结构化数据：保留缩进便于LLM阅读，允许非字符串键（如统计分布中的年份）
+_PROMPT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
 class ReportAgent:
     def __init__(self, config: Dict[str, Any], llm):
         self.config = config
         self.llm = llm
-        self.log_handler = AgentLogHandler()
         self.chain = self._init_chain()
         self.save_path = config["agent"]["report"]["save_path"]
         os.makedirs(self.save_path, exist_ok=True)
@@ -59,13 +63,8 @@ class ReportAgent:
               - 若某字段为空/未知，标注「未明确提及」
               - 统计数据为空时标注「无有效数据」"""
 
-        # 用户提示词：明确传入参数格式
-        user_prompt = """### 输入数据
-        【文献分析结果（含新字段）】：{literature_data}
-        【数据处理结果】：{data_process_data}
-        【检索关键词】：{keywords}
-
-        ### 新字段说明
+        # 用户提示词：静态说明在前、动态数据在后，保持提示词前缀稳定以命中服务端前缀缓存
+        user_prompt = """### 新字段说明
         - background：研究背景（中文分条）
         - methods_original：研究方法中文分条概括
         - methods_original_raw：研究方法原始文本（可能英文）
@@ -75,7 +74,12 @@ class ReportAgent:
         - limitations：局限性中文分条
 
         ### 输出要求
-        严格按照系统规则生成Markdown报告；必须优先使用新字段，不要忽略。无需额外解释，直接输出报告内容。"""
+        严格按照系统规则生成Markdown报告；必须优先使用新字段，不要忽略。无需额外解释，直接输出报告内容。
+
+        ### 输入数据
+        【检索关键词】：{keywords}
+        【文献分析结果（含新字段）】：{literature_data}
+        【数据处理结果】：{data_process_data}"""
 
         prompt = ChatPromptTemplate.from_messages([
             ("system", system_prompt),
@@ -90,11 +94,8 @@ class ReportAgent:
             return data
         try:
             # 清洗可能的markdown包裹（```json ... ```）
-            clean_data = data.strip()
-            if clean_data.startswith("```"):
-                clean_data = clean_data.split("```")[1].replace("json", "").strip()
-            return json.loads(clean_data)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(strip_json_fence(data))
+        except (orjson.JSONDecodeError, TypeError):
             # 解析失败返回空字典，让LLM处理缺失
             return {}
 
@@ -127,11 +128,8 @@ class ReportAgent:
 
         chain = prompt | self.llm | StrOutputParser()
         try:
-            raw = chain.invoke({"papers_json": json.dumps(payload, ensure_ascii=False)})
-            text = raw.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1].replace("json", "").strip()
-            parsed = json.loads(text)
+            raw = chain.invoke({"papers_json": orjson.dumps(payload).decode()})
+            parsed = orjson.loads(strip_json_fence(raw))
             if isinstance(parsed, list):
                 return [item for item in parsed if isinstance(item, dict)]
         except Exception:
@@ -147,29 +145,40 @@ class ReportAgent:
             for p in papers
         ]
 
-    def run(self, keywords: str, literature_data: str | Dict[str, Any], data_process_data: str | Dict[str, Any]) -> Dict[str, Any]:
+    async def arun(self, keywords: str, literature_data: str | Dict[str, Any], data_process_data: str | Dict[str, Any]) -> Dict[str, Any]:
         """生成报告（适配Agent链输入，优化数据解析和保存）"""
         try:
             # 1. 解析输入数据（统一转为字典）
             lit_data = self._parse_input_data(literature_data)
             data_data = self._parse_input_data(data_process_data)
 
-            # 2. 生成报告内容（传入结构化参数）
-            report_content = self.chain.invoke({
-                "keywords": keywords,
-                "literature_data": json.dumps(lit_data, ensure_ascii=False, indent=2),
-                "data_process_data": json.dumps(data_data, ensure_ascii=False, indent=2)
-            })
-
-            # 3. 生成唯一文件名（时间戳+关键词，避免重复）
+            # 2. 生成唯一文件名（时间戳+关键词+随机后缀，同一秒内相同关键词的并发请求也不会重名）
             safe_keywords = keywords.replace(" ", "_").replace("/", "_").replace("\\", "_")[:20]
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_filename = f"research_report_{safe_keywords}_{timestamp}.md"
+            report_filename = f"research_report_{safe_keywords}_{timestamp}_{uuid4().hex[:6]}.md"
             report_path = os.path.join(self.save_path, report_filename)
 
-            # 4. 保存报告（UTF-8编码避免中文乱码）
-            with open(report_path, "w", encoding="utf-8") as f:
-                f.write(report_content)
+            # 3. 流式生成报告，边生成边写入文件（UTF-8编码避免中文乱码）
+            chain_inputs = {
+                "keywords": keywords,
+                "literature_data": orjson.dumps(lit_data, option=_PROMPT_JSON_OPTIONS).decode(),
+                "data_process_data": orjson.dumps(data_data, option=_PROMPT_JSON_OPTIONS).decode()
+            }
+            report_parts = []
+            # 先写入本次请求独有的临时文件，生成完成后再原子替换为正式报告
+            tmp_path = f"{report_path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    async for chunk in self.chain.astream(chain_inputs):
+                        f.write(chunk)
+                        report_parts.append(chunk)
+                os.replace(tmp_path, report_path)
+            except Exception:
+                # 生成中断时不保留不完整的报告文件
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            report_content = "".join(report_parts)
 
             return {
                 "status": "success",
@@ -192,4 +201,13 @@ class ReportAgent:
                 "report_content": "",
                 "report_path": "",
                 "metadata": {}
-            }
\ No newline at end of file
+            }
+
+    def run(self, keywords: str, literature_data: str | Dict[str, Any], data_process_data: str | Dict[str, Any]) -> Dict[str, Any]:
+        return run_sync(
+            self.arun(
+                keywords=keywords,
+                literature_data=literature_data,
+                data_process_data=data_process_data,
+            )
+        )
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, List
+
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, convert_to_messages, get_buffer_string
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import Runnable, RunnableConfig
+
+
+class LLMResponseCache:
+    """LLM响应缓存：按提示词sha256精确命中。
+
+    不做向量近似匹配：提示词中固定指令占比很高，内嵌不同文献数据的提示词也会高度相似，近似命中会返回其他文献的结果。
+    持久化使用SQLite逐条写入，由后台线程完成，调用方（包括共享事件循环）不等待磁盘I/O。
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        max_completion_chars: int = 8000,
+        persist_path: str | None = None,
+    ) -> None:
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        # 超长输出（如整篇报告）几乎不会原样复用，不缓存，避免内存与磁盘占用随报告体积膨胀
+        self.max_completion_chars = max_completion_chars
+        self.persist_path = persist_path
+        self._responses: OrderedDict[str, tuple[str, str]] = OrderedDict()
+        self._pending: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        if self.persist_path:
+            self._load()
+            atexit.register(self.flush)
+
+    def _connect(self) -> sqlite3.Connection:
+        path = Path(self.persist_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 多个worker共用同一数据库文件，由SQLite的文件锁串行化写入
+        conn = sqlite3.connect(path, timeout=30)
+        # 新建库时启用，淘汰旧条目后释放的页归还给文件系统
+        conn.execute("PRAGMA auto_vacuum=FULL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, namespace TEXT NOT NULL, completion TEXT NOT NULL)"
+        )
+        return conn
+
+    def _load(self) -> None:
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT key, namespace, completion FROM responses ORDER BY rowid DESC LIMIT ?",
+                    (self.max_entries,),
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            # 缓存文件损坏或格式不兼容时从空缓存开始
+            return
+        for key, namespace, completion in reversed(rows):
+            self._responses[key] = (namespace, completion)
+
+    def _ensure_writer(self) -> None:
+        with self._lock:
+            # fork 之后线程不会被继承，需要在子进程中重新拉起
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name="llm-cache-writer", daemon=True)
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        try:
+            conn = self._connect()
+        except sqlite3.Error:
+            return
+        stop = False
+        while not stop:
+            rows = [self._pending.get()]
+            # 合并已排队的条目，一个事务写入
+            while True:
+                try:
+                    rows.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            if None in rows:
+                stop = True
+                rows = [row for row in rows if row is not None]
+            if not rows:
+                continue
+            try:
+                with conn:
+                    # REPLACE会分配新rowid，rowid越大越新；只保留最新的max_entries条
+                    conn.executemany("INSERT OR REPLACE INTO responses (key, namespace, completion) VALUES (?, ?, ?)", rows)
+                    conn.execute(
+                        "DELETE FROM responses WHERE rowid <= (SELECT MAX(rowid) FROM responses) - ?",
+                        (self.max_entries,),
+                    )
+            except sqlite3.Error:
+                # 持久化失败不影响内存缓存
+                pass
+        conn.close()
+
+    def flush(self, timeout: float = 5.0) -> None:
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return
+        self._pending.put(None)
+        writer.join(timeout)
+
+    def _key(self, namespace: str, prompt: str) -> str:
+        return hashlib.sha256(f"{namespace}\n{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, namespace: str, prompt: str) -> str | None:
+        key = self._key(namespace, prompt)
+        with self._lock:
+            if key not in self._responses:
+                return None
+            self._responses.move_to_end(key)
+            return self._responses[key][1]
+
+    def store(self, namespace: str, prompt: str, completion: str) -> None:
+        if len(completion) > self.max_completion_chars:
+            return
+        key = self._key(namespace, prompt)
+        with self._lock:
+            if key in self._responses:
+                self._responses.move_to_end(key)
+                return
+            self._responses[key] = (namespace, completion)
+            while len(self._responses) > self.max_entries:
+                self._responses.popitem(last=False)
+        if self.persist_path:
+            self._ensure_writer()
+            self._pending.put((key, namespace, completion))
+
+
+llm_response_cache = LLMResponseCache(persist_path="./data/llm_cache/response_cache.sqlite3")
+
+
+class CachingChatModel(Runnable[LanguageModelInput, BaseMessage]):
+    """包装ChatModel：低温度（近似确定性）调用复用历史响应，可直接用于LCEL链。"""
+
+    def __init__(
+        self,
+        llm: Any,
+        cache: LLMResponseCache | None = None,
+        max_temperature: float = 0.1,
+    ) -> None:
+        self.llm = llm
+        self.cache = cache or llm_response_cache
+        self.max_temperature = max_temperature
+        self.namespace = f"{getattr(llm, 'model_name', '')}@{getattr(llm, 'openai_api_base', '')}"
+
+    def _cacheable(self) -> bool:
+        temperature = getattr(self.llm, "temperature", None)
+        return temperature is not None and temperature <= self.max_temperature
+
+    def _prompt_text(self, input: LanguageModelInput) -> str:
+        if isinstance(input, str):
+            return input
+        if isinstance(input, PromptValue):
+            return input.to_string()
+        return get_buffer_string(convert_to_messages(input))
+
+    def invoke(self, input: LanguageModelInput, config: RunnableConfig | None = None, **kwargs: Any) -> BaseMessage:
+        if not self._cacheable():
+            return self.llm.invoke(input, config, **kwargs)
+        prompt = self._prompt_text(input)
+        cached = self.cache.lookup(self.namespace, prompt)
+        if cached is not None:
+            return AIMessage(content=cached)
+        message = self.llm.invoke(input, config, **kwargs)
+        if isinstance(message.content, str):
+            self.cache.store(self.namespace, prompt, message.content)
+        return message
+
+    async def ainvoke(self, input: LanguageModelInput, config: RunnableConfig | None = None, **kwargs: Any) -> BaseMessage:
+        if not self._cacheable():
+            return await self.llm.ainvoke(input, config, **kwargs)
+        prompt = self._prompt_text(input)
+        cached = self.cache.lookup(self.namespace, prompt)
+        if cached is not None:
+            return AIMessage(content=cached)
+        message = await self.llm.ainvoke(input, config, **kwargs)
+        if isinstance(message.content, str):
+            self.cache.store(self.namespace, prompt, message.content)
+        return message
+
+    def stream(self, input: LanguageModelInput, config: RunnableConfig | None = None, **kwargs: Any) -> Iterator[BaseMessage]:
+        if not self._cacheable():
+            yield from self.llm.stream(input, config, **kwargs)
+            return
+        prompt = self._prompt_text(input)
+        cached = self.cache.lookup(self.namespace, prompt)
+        if cached is not None:
+            yield AIMessageChunk(content=cached)
+            return
+        parts: List[str] = []
+        for chunk in self.llm.stream(input, config, **kwargs):
+            if isinstance(chunk.content, str):
+                parts.append(chunk.content)
+            yield chunk
+        self.cache.store(self.namespace, prompt, "".join(parts))
+
+    async def astream(self, input: LanguageModelInput, config: RunnableConfig | None = None, **kwargs: Any) -> AsyncIterator[BaseMessage]:
+        if not self._cacheable():
+            async for chunk in self.llm.astream(input, config, **kwargs):
+                yield chunk
+            return
+        prompt = self._prompt_text(input)
+        cached = self.cache.lookup(self.namespace, prompt)
+        if cached is not None:
+            yield AIMessageChunk(content=cached)
+            return
+        parts: List[str] = []
+        async for chunk in self.llm.astream(input, config, **kwargs):
+            if isinstance(chunk.content, str):
+                parts.append(chunk.content)
+            yield chunk
+        self.cache.store(self.namespace, prompt, "".join(parts))
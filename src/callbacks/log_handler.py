@@ -1,61 +1,75 @@
 import time
+from collections import deque
+from dataclasses import dataclass
 from langchain_core.callbacks.base import BaseCallbackHandler
-from typing import Any, Dict, List
+from typing import Any, Deque, Dict, Iterator
+
+
+@dataclass(slots=True)
+class LogEvent:
+    """轻量日志事件：只记录原始数据，时间戳与耗时在读取日志时再换算"""
+    type: str
+    ts_ns: int
+    payload: Dict[str, Any]
+
 
 class AgentLogHandler(BaseCallbackHandler):
-    def __init__(self):
-        self.logs = []
-        self.start_time = None
+    def __init__(self, max_events: int = 1024):
+        # 有界缓冲，避免长期运行的服务进程中日志无限增长
+        self.logs: Deque[LogEvent] = deque(maxlen=max_events)
+        self.start_ns = None
+        # 单调时钟与墙上时钟的对应关系，用于在读取时还原时间戳
+        self._wall_anchor = time.time()
+        self._mono_anchor_ns = time.monotonic_ns()
 
     def on_chain_start(
         self, serialized: Dict[str, Any], inputs: Dict[str, Any], **kwargs: Any
     ) -> None:
         """链启动时记录"""
-        self.start_time = time.time()
-        self.logs.append({
-            "type": "chain_start",
-            "chain_name": serialized.get("name", "unknown"),
+        # 顶层链（无父run）启动即一次新的调用，清空上一次调用的日志
+        if kwargs.get("parent_run_id") is None:
+            self.logs.clear()
+        self.start_ns = time.monotonic_ns()
+        self.logs.append(LogEvent("chain_start", self.start_ns, {
+            "chain_name": (serialized or {}).get("name", "unknown"),
             "inputs": inputs,
-            "timestamp": time.time()
-        })
+        }))
 
     def on_chain_end(self, outputs: Dict[str, Any], **kwargs: Any) -> None:
         """链结束时记录"""
-        elapsed = time.time() - self.start_time
-        self.logs.append({
-            "type": "chain_end",
+        self.logs.append(LogEvent("chain_end", time.monotonic_ns(), {
             "outputs": outputs,
-            "elapsed_time": elapsed,
-            "timestamp": time.time()
-        })
+            "start_ns": self.start_ns,
+        }))
 
     def on_tool_start(
         self, serialized: Dict[str, Any], input_str: str, **kwargs: Any
     ) -> None:
         """工具调用启动时记录"""
-        self.logs.append({
-            "type": "tool_start",
-            "tool_name": serialized.get("name", "unknown"),
+        self.logs.append(LogEvent("tool_start", time.monotonic_ns(), {
+            "tool_name": (serialized or {}).get("name", "unknown"),
             "input": input_str,
-            "timestamp": time.time()
-        })
+        }))
 
     def on_tool_end(self, output_str: str, **kwargs: Any) -> None:
         """工具调用结束时记录"""
-        self.logs.append({
-            "type": "tool_end",
-            "output": output_str,
-            "timestamp": time.time()
-        })
+        self.logs.append(LogEvent("tool_end", time.monotonic_ns(), {"output": output_str}))
 
     def on_error(self, error: Exception, **kwargs: Any) -> None:
         """错误时记录"""
-        self.logs.append({
-            "type": "error",
-            "error": str(error),
-            "timestamp": time.time()
-        })
-
-    def get_logs(self) -> List[Dict[str, Any]]:
-        """获取所有日志"""
-        return self.logs
\ No newline at end of file
+        self.logs.append(LogEvent("error", time.monotonic_ns(), {"error": str(error)}))
+
+    def _to_wall_time(self, ts_ns: int) -> float:
+        return self._wall_anchor + (ts_ns - self._mono_anchor_ns) / 1e9
+
+    def get_logs(self) -> Iterator[Dict[str, Any]]:
+        """按需逐条生成日志字典"""
+        for event in list(self.logs):
+            entry = {"type": event.type}
+            payload = dict(event.payload)
+            start_ns = payload.pop("start_ns", None)
+            entry.update(payload)
+            if event.type == "chain_end":
+                entry["elapsed_time"] = (event.ts_ns - start_ns) / 1e9 if start_ns is not None else 0.0
+            entry["timestamp"] = self._to_wall_time(event.ts_ns)
+            yield entry
@@ -54,7 +54,7 @@ class MCPToolClient:
 
         return {"status": "error", "message": f"无法解析MCP返回结果: {result}"}
 
-    def search_pubmed(
+    async def asearch_pubmed(
         self,
         query: str,
         email: str,
@@ -63,43 +63,65 @@ class MCPToolClient:
         end_date: str | None = None,
         retstart: int = 0,
         sort: str = "relevance",
+        api_key: str | None = None,
     ) -> Dict[str, Any]:
         try:
-            return asyncio.run(
-                self._call_tool(
-                    "pubmed_search",
-                    {
-                        "query": query,
-                        "email": email,
-                        "max_papers": max_papers,
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "retstart": retstart,
-                        "sort": sort,
-                    },
-                )
+            return await self._call_tool(
+                "pubmed_search",
+                {
+                    "query": query,
+                    "email": email,
+                    "max_papers": max_papers,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "retstart": retstart,
+                    "sort": sort,
+                    "api_key": api_key,
+                },
             )
         except Exception as exc:
             message = str(exc)
             if "Connection closed" in message:
                 raise RuntimeError(
-                    "MCP工具连接中断（Connection closed）。常见原因：1）依赖缺失（如 biopython）；"
+                    "MCP工具连接中断（Connection closed）。常见原因：1）依赖缺失（如 lxml、requests）；"
                     "2）MCP server 初始化异常。请先执行 `python -m pip install -r requirements.txt`。"
                 ) from exc
             raise
 
-    def process_data(self, papers_data: List[Dict[str, Any]], analysis_type: str = "all", plot_format: str = "png", save_path: str = "./plots") -> Dict[str, Any]:
+    def search_pubmed(
+        self,
+        query: str,
+        email: str,
+        max_papers: int,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        retstart: int = 0,
+        sort: str = "relevance",
+        api_key: str | None = None,
+    ) -> Dict[str, Any]:
+        return asyncio.run(
+            self.asearch_pubmed(
+                query=query,
+                email=email,
+                max_papers=max_papers,
+                start_date=start_date,
+                end_date=end_date,
+                retstart=retstart,
+                sort=sort,
+                api_key=api_key,
+            )
+        )
+
+    async def aprocess_data(self, papers_data: List[Dict[str, Any]], analysis_type: str = "all", plot_format: str = "png", save_path: str = "./plots") -> Dict[str, Any]:
         try:
-            return asyncio.run(
-                self._call_tool(
-                    "data_process",
-                    {
-                        "papers_data": papers_data,
-                        "analysis_type": analysis_type,
-                        "plot_format": plot_format,
-                        "save_path": save_path,
-                    },
-                )
+            return await self._call_tool(
+                "data_process",
+                {
+                    "papers_data": papers_data,
+                    "analysis_type": analysis_type,
+                    "plot_format": plot_format,
+                    "save_path": save_path,
+                },
             )
         except Exception as exc:
             message = str(exc)
@@ -108,3 +130,13 @@ class MCPToolClient:
                     "MCP工具连接中断（Connection closed）。请检查依赖安装和MCP server初始化日志。"
                 ) from exc
             raise
+
+    def process_data(self, papers_data: List[Dict[str, Any]], analysis_type: str = "all", plot_format: str = "png", save_path: str = "./plots") -> Dict[str, Any]:
+        return asyncio.run(
+            self.aprocess_data(
+                papers_data=papers_data,
+                analysis_type=analysis_type,
+                plot_format=plot_format,
+                save_path=save_path,
+            )
+        )
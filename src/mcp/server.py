@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict, List
 
 from fastmcp import FastMCP
@@ -10,9 +11,16 @@ from src.tools.pubmed_tool import PubMedSearchTool
 mcp = FastMCP("medical_research_tools")
 
 
-def _build_config(email: str, max_papers: int = 10, plot_format: str = "png", save_path: str = "./plots") -> Dict[str, Any]:
+def _build_config(
+    email: str,
+    max_papers: int = 10,
+    plot_format: str = "png",
+    save_path: str = "./plots",
+    api_key: str | None = None,
+) -> Dict[str, Any]:
     return {
         "entrez_email": email,
+        "entrez_api_key": api_key,
         "agent": {
             "literature": {"max_papers": max_papers},
             "data": {"plot_format": plot_format, "save_path": save_path},
@@ -21,7 +29,7 @@ def _build_config(email: str, max_papers: int = 10, plot_format: str = "png", sa
 
 
 @mcp.tool
-def pubmed_search(
+async def pubmed_search(
     query: str,
     email: str,
     max_papers: int = 10,
@@ -29,10 +37,11 @@ def pubmed_search(
     end_date: str | None = None,
     retstart: int = 0,
     sort: str = "relevance",
+    api_key: str | None = None,
 ) -> Dict[str, Any]:
     """检索PubMed文献并返回结构化结果。"""
-    tool = PubMedSearchTool(_build_config(email=email, max_papers=max_papers))
-    return tool._run(
+    tool = PubMedSearchTool.from_config(_build_config(email=email, max_papers=max_papers, api_key=api_key))
+    return await tool._arun(
         keywords=query,
         start_date=start_date,
         end_date=end_date,
@@ -42,11 +51,11 @@ def pubmed_search(
 
 
 @mcp.tool
-def data_process(papers_data: List[Dict[str, Any]], analysis_type: str = "all", plot_format: str = "png", save_path: str = "./plots") -> Dict[str, Any]:
+async def data_process(papers_data: List[Dict[str, Any]], analysis_type: str = "all", plot_format: str = "png", save_path: str = "./plots") -> Dict[str, Any]:
     """对论文列表进行统计分析（仅返回分布统计，不生成图表）。"""
     config = _build_config(email="local@localhost", plot_format=plot_format, save_path=save_path)
     tool = DataProcessTool(config)
-    return tool._run(papers_data=papers_data, analysis_type=analysis_type)
+    return await asyncio.to_thread(tool._run, papers_data=papers_data, analysis_type=analysis_type)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 import re
+import zlib
 from pathlib import Path
 from threading import Lock
 from typing import Any, Dict, List, Tuple
@@ -19,7 +20,8 @@ class HashEmbeddings(Embeddings):
         if not tokens:
             return vec
         for token in tokens:
-            idx = hash(token) % self.dim
+            # 使用稳定哈希：内置hash()按进程随机化，持久化的向量在重启后将无法对齐
+            idx = zlib.crc32(token.encode("utf-8")) % self.dim
             vec[idx] += 1.0
         norm = math.sqrt(sum(x * x for x in vec)) or 1.0
         return [x / norm for x in vec]
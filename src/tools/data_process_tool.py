@@ -1,10 +1,15 @@
 import pandas as pd
-import numpy as np
+from collections import Counter
+from functools import lru_cache
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
+from statistics import fmean
 from typing import ClassVar, List, Dict, Any
 import os
 
+# 小样本（默认检索10~50篇）直接用Counter统计，DataFrame构建与类型推断的开销远大于统计本身
+SMALL_INPUT_THRESHOLD = 200
+
 class DataProcessInput(BaseModel):
     papers_data: List[Dict[str, Any]] = Field(description="文献分析师返回的论文数据")
     analysis_type: str = Field(default="stat", description="分析类型：stat(统计)，plot参数将被忽略")
@@ -35,20 +40,70 @@ class DataProcessTool(BaseTool):
         # 保持目录初始化兼容，但当前版本不写入图表
         os.makedirs(self.save_path, exist_ok=True)
 
-    def _parse_publish_year(self, date_str: str) -> str:
-        """解析发表时间为年份（用于时间分布统计）"""
-        if not date_str or date_str == "未知":
-            return "未知"
-        try:
-            # 匹配 YYYY-MM-DD / YYYY-MM / YYYY 格式
-            if "-" in date_str:
-                return date_str.split("-")[0]
-            elif date_str.isdigit() and len(date_str) == 4:
-                return date_str
-            else:
-                return "未知"
-        except:
-            return "未知"
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_publish_year(date_str: str) -> str:
+        """解析发表时间为年份（取开头4位数字，用于时间分布统计）；日期取值高度重复，结果按值缓存"""
+        return date_str[:4] if len(date_str) >= 4 and date_str[:4].isdecimal() else "未知"
+
+    def _stat_small(self, papers_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """小样本统计：纯Python单遍提取字段，结果与pandas分支一致"""
+        methods, years, journals, author_counts = [], [], [], []
+        for paper in papers_data:
+            method = paper.get("methods_classified")
+            methods.append("其他研究" if method is None else method)
+            date = paper.get("publish_date")
+            years.append(self._parse_publish_year("未知" if date is None else str(date)))
+            journal = paper.get("journal_name")
+            journals.append("未知" if journal is None else journal)
+            authors = paper.get("authors")
+            author_counts.append(len(authors) if isinstance(authors, list) else 0)
+
+        return {
+            "total_papers": len(papers_data),
+            "methods_classified_distribution": dict(Counter(methods).most_common()),
+            "publish_year_distribution": dict(Counter(years).most_common()),
+            "journal_distribution": dict(Counter(journals).most_common(10)),
+            "author_count_stat": {
+                "avg": round(fmean(author_counts), 2),
+                "max": max(author_counts),
+                "min": min(author_counts)
+            }
+        }
+
+    def _stat_pandas(self, papers_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """大样本统计：DataFrame整列向量化计算"""
+        # 数据清洗（核心：匹配literature_agent的字段）
+        df = pd.DataFrame(papers_data)
+        # 填充缺失值（authors为列表列，fillna不接受列表，在作者数量统计时单独处理）
+        df = df.fillna({
+            "title": "未知",
+            "publish_date": "未知",
+            "journal_name": "未知",
+            "methods_original": "未知",
+            "methods_classified": "其他研究",
+            "conclusion": "未知",
+        })
+
+        # 衍生字段：发表年份、作者数量（整列向量化计算，避免逐行apply）
+        df["publish_year"] = df["publish_date"].astype(str).str.extract(r"^(\d{4})", expand=False).fillna("未知")
+        df["author_count"] = df["authors"].map(lambda x: len(x) if isinstance(x, list) else 0).astype("int32")
+
+        return {
+            "total_papers": len(df),
+            # 研究方法分类分布（匹配literature_agent的分类）
+            "methods_classified_distribution": df["methods_classified"].value_counts().to_dict(),
+            # 发表年份分布
+            "publish_year_distribution": df["publish_year"].value_counts().to_dict(),
+            # 期刊分布（取Top10）
+            "journal_distribution": df["journal_name"].value_counts().head(10).to_dict(),
+            # 作者数量统计
+            "author_count_stat": {
+                "avg": round(float(df["author_count"].mean()), 2),
+                "max": int(df["author_count"].max()),
+                "min": int(df["author_count"].min())
+            }
+        }
 
     def _run(self, papers_data: List[Dict[str, Any]], analysis_type: str = "all") -> Dict[str, Any]:
         """执行数据处理（适配literature_agent的输出字段，仅做统计不绘图）。"""
@@ -68,45 +123,16 @@ class DataProcessTool(BaseTool):
                     "plot_count": 0,
                 }
 
-            # 数据清洗（核心：匹配literature_agent的字段）
-            df = pd.DataFrame(papers_data)
-            # 填充缺失值
-            df = df.fillna({
-                "title": "未知",
-                "publish_date": "未知",
-                "journal_name": "未知",
-                "methods_original": "未知",
-                "methods_classified": "其他研究",
-                "conclusion": "未知",
-                "authors": []
-            })
-            
-            # 衍生字段：发表年份、作者数量
-            df["publish_year"] = df["publish_date"].apply(self._parse_publish_year)
-            df["author_count"] = df["authors"].apply(lambda x: len(x) if isinstance(x, list) else 0)
-
-            # 统计分析
-            stat_result = {
-                "total_papers": len(df),
-                # 研究方法分类分布（匹配literature_agent的分类）
-                "methods_classified_distribution": df["methods_classified"].value_counts().to_dict(),
-                # 发表年份分布
-                "publish_year_distribution": df["publish_year"].value_counts().to_dict(),
-                # 期刊分布（取Top10）
-                "journal_distribution": df["journal_name"].value_counts().head(10).to_dict(),
-                # 作者数量统计
-                "author_count_stat": {
-                    "avg": round(np.mean(df["author_count"]), 2),
-                    "max": df["author_count"].max(),
-                    "min": df["author_count"].min()
-                }
-            }
+            if len(papers_data) <= SMALL_INPUT_THRESHOLD:
+                stat_result = self._stat_small(papers_data)
+            else:
+                stat_result = self._stat_pandas(papers_data)
 
             plot_paths = []
 
             return {
                 "status": "success",
-                "message": f"数据处理完成：共分析{len(df)}篇论文，已返回分布统计（未生成图表）",
+                "message": f"数据处理完成：共分析{stat_result['total_papers']}篇论文，已返回分布统计（未生成图表）",
                 "statistic": stat_result,
                 "plot_paths": plot_paths,
                 "plot_count": len(plot_paths),
@@ -1,12 +1,143 @@
-import xml.etree.ElementTree as ET
+import asyncio
+import copy
+import importlib.util
+import threading
+import time
+import weakref
+import httpx
+import orjson
+from cachetools import TTLCache
+from concurrent.futures import Future
 from langchain_core.tools import BaseTool
+from lxml import etree as LET
 from pydantic import BaseModel, Field
-from typing import ClassVar, Dict, Any
-from Bio import Entrez  # Biopython简化PubMed检索
+from typing import ClassVar, Dict, Any, Iterator, List, NamedTuple
 
-RESEARCH_METHOD_TYPES = [
+RESEARCH_METHOD_TYPES = (
     "横断面研究", "队列研究", "病例报告", "RCT研究", "病例对照研究", "综述", "其他研究"
-]
+)
+
+# 字段缺失时的占位值
+_UNKNOWN = "未知"
+_NOT_MENTIONED = "未提及"
+_UNKNOWN_TITLE = "未知标题"
+# Paper.authors为元组，所有无作者信息的论文共享同一个占位元组
+_UNKNOWN_AUTHORS = ("未知作者",)
+
+# efetch 单次请求的PMID数量上限（ID列表以POST表单提交，分批用于并发与失败重试）
+EFETCH_BATCH_SIZE = 200
+# 无API Key时 Entrez 限制约3次/秒，控制并发请求数
+ENTREZ_MAX_CONCURRENCY = 3
+
+EUTILS_BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
+ENTREZ_TOOL_NAME = "MetaMedAI"
+ENTREZ_TIMEOUT = 30
+# NCBI速率限制：无API Key 3次/秒，带API Key 10次/秒
+ENTREZ_RATE_LIMIT = 3
+ENTREZ_RATE_LIMIT_WITH_KEY = 10
+# NCBI 偶发限流/服务端错误时的重试次数与退避基数（秒）
+ENTREZ_MAX_RETRIES = 3
+ENTREZ_RETRY_BACKOFF = 1.0
+ENTREZ_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+# 检索结果缓存：同一会话内重复/重试的相同检索直接复用
+PUBMED_CACHE_SIZE = 256
+PUBMED_CACHE_TTL = 3600
+
+# 预编译XPath：由libxml2在C层求值，避免逐篇论文重复解析路径字符串
+# PubMed DTD固定了节点层级（Journal/Abstract/ArticleDate为Article的直接子节点），统一用子轴路径，不做子树递归查找
+_XP_ARTICLE = LET.XPath("MedlineCitation/Article")
+_XP_TITLE = LET.XPath("string(ArticleTitle)")
+_XP_PUBDATE = LET.XPath("Journal/JournalIssue/PubDate")
+_XP_ARTICLE_DATE = LET.XPath("ArticleDate")
+_XP_YMD = LET.XPath("Year/text() | Month/text() | Day/text()")
+_XP_JOURNAL = LET.XPath("string(Journal/Title)")
+_XP_ABSTRACT_TEXTS = LET.XPath("Abstract/AbstractText")
+_XP_PMID = LET.XPath("string(PMID)")
+_XP_ARTICLE_ID = LET.XPath("string(PubmedData/ArticleIdList/ArticleId[@IdType=$id_type][normalize-space()][1])")
+_XP_AUTHORS = LET.XPath("AuthorList/Author[LastName]")
+# XPath 1.0 无法对节点集逐个concat，按作者节点求值，字符串在libxml2中拼接
+_XP_AUTHOR_NAME = LET.XPath("concat(LastName, ' ', Initials)")
+
+# 检索失败时返回的模拟数据
+_MOCK_PAPERS = tuple(
+    {
+        "title": f"模拟论文{i}",
+        "publish_date": "2024-01-01",
+        "journal_name": "模拟期刊",
+        "methods_original": "随机对照试验（RCT）研究，选取100例患者分为实验组和对照组",
+        "conclusion": "模拟结论：该治疗方案有效",
+        "authors": ["Author A"]
+    }
+    for i in range(10)
+)
+
+# efetch解析器选项：大批量响应放开libxml2的节点/文本长度限制；PubMed不使用ID与自定义实体，关闭以减少解析开销。
+# 不启用remove_blank_text：标题等混合内容中元素间的空格（如 <i>A</i> <i>B</i>）会被误删
+_ARTICLE_PARSER_OPTIONS = {
+    "events": ("end",),
+    "tag": "PubmedArticle",
+    "huge_tree": True,
+    "collect_ids": False,
+    "resolve_entities": False,
+}
+
+# 摘要段落标签（大写）到结果字段的映射
+_ABSTRACT_LABEL_MAP = {"METHODS": "methods", "CONCLUSION": "conclusion"}
+
+
+# 安装了h2（httpx[http2]）时启用HTTP/2，同一连接上多路复用esearch与多批efetch
+_CLIENT_OPTIONS: Dict[str, Any] = {
+    "base_url": EUTILS_BASE_URL,
+    "http2": importlib.util.find_spec("h2") is not None,
+    "timeout": ENTREZ_TIMEOUT,
+    "limits": httpx.Limits(max_keepalive_connections=ENTREZ_RATE_LIMIT_WITH_KEY),
+}
+
+
+class _RateLimiter:
+    """进程内共享的请求节流：保证相邻两次E-utilities请求的最小间隔"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def _reserve(self, rate: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            wait_for = self._next_at - now
+            self._next_at = max(now, self._next_at) + 1.0 / rate
+        return wait_for
+
+    def wait(self, rate: int) -> None:
+        wait_for = self._reserve(rate)
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+    async def await_slot(self, rate: int) -> None:
+        wait_for = self._reserve(rate)
+        if wait_for > 0:
+            await asyncio.sleep(wait_for)
+
+
+# 工具在每次MCP调用时新建实例，HTTP客户端与节流器放在模块级，跨调用复用keep-alive连接池
+_HTTP = httpx.Client(**_CLIENT_OPTIONS)
+# 异步连接池绑定创建它的事件循环，按循环各建一个客户端
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_RATE_LIMITER = _RateLimiter()
+
+# 只缓存最终的论文字典（不保留XML），进行中的检索以Future登记，相同的并发检索共享一次网络请求
+_RESULT_CACHE: TTLCache = TTLCache(maxsize=PUBMED_CACHE_SIZE, ttl=PUBMED_CACHE_TTL)
+_INFLIGHT: Dict[tuple, Future] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        client = _ASYNC_CLIENTS[loop] = httpx.AsyncClient(**_CLIENT_OPTIONS)
+    return client
+
 
 class PubMedSearchInput(BaseModel):
     keywords: str = Field(description="检索关键词")
@@ -15,83 +146,330 @@ class PubMedSearchInput(BaseModel):
     retstart: int = Field(default=0, description="结果偏移量")
     sort: str = Field(default="relevance", description="排序方式：relevance/pub date")
 
+class Paper(NamedTuple):
+    """解析后的单篇论文：元组存储，缓存中大量论文的内存占用远小于字典"""
+    title: str
+    publish_date: str
+    journal_name: str
+    methods_original: str
+    conclusion: str
+    doi: str
+    pmid: str
+    source: str
+    authors: tuple[str, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为对外输出的论文字典（每次返回新对象）"""
+        paper = self._asdict()
+        paper["authors"] = list(self.authors)
+        return paper
+
+
+def _export_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """对外返回前将Paper转换为字典；模拟数据为共享字典，深拷贝后返回"""
+    data = [paper.to_dict() if isinstance(paper, Paper) else copy.deepcopy(paper) for paper in result["data"]]
+    return {**result, "data": data}
+
+
 class PubMedSearchTool(BaseTool):
     name: ClassVar[str] = "pubmed_search"
     description: ClassVar[str] = "检索PubMed数据库获取相关论文，返回题目、研究方法、结论等信息"
     args_schema: ClassVar[type[BaseModel]] = PubMedSearchInput
     max_papers: int = Field(default=10, description="最大检索论文数量")
-    
-    
+    entrez_email: str = Field(default="", description="NCBI要求的联系邮箱")
+    entrez_api_key: str | None = Field(default=None, description="NCBI API Key，可将速率上限提升至10次/秒")
 
-    def __init__(self, config: Dict):
-        
-        Entrez.email = config["entrez_email"]  # 必须填写邮箱
-        max_papers = config.get("agent", {}).get("literature", {}).get("max_papers", 10)
-        # 父类初始化
-        super().__init__(max_papers=max_papers)
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "PubMedSearchTool":
+        """由运行时配置构建工具；字段经pydantic常规校验，无全局副作用"""
+        return cls(
+            max_papers=config.get("agent", {}).get("literature", {}).get("max_papers", 10),
+            entrez_email=config["entrez_email"],  # 必须填写邮箱
+            entrez_api_key=config.get("entrez_api_key") or None,
+        )
 
-    def _extract_publish_date(self, article: ET.Element) -> str:
+    def _rate_limit(self) -> int:
+        return ENTREZ_RATE_LIMIT_WITH_KEY if self.entrez_api_key else ENTREZ_RATE_LIMIT
+
+    def _build_request(
+        self,
+        client: httpx.Client | httpx.AsyncClient,
+        method: str,
+        endpoint: str,
+        params: Dict[str, Any],
+    ) -> httpx.Request:
+        params = {**params, "tool": ENTREZ_TOOL_NAME, "email": self.entrez_email}
+        if self.entrez_api_key:
+            params["api_key"] = self.entrez_api_key
+        if method == "POST":
+            # 参数以表单提交，不受URL长度限制
+            return client.build_request("POST", endpoint, data=params)
+        return client.build_request("GET", endpoint, params=params)
+
+    def _send(self, endpoint: str, params: Dict[str, Any], method: str = "GET") -> httpx.Response:
+        """请求E-utilities接口（流式响应，调用方负责关闭），429/5xx及连接错误自动退避重试"""
+        request = self._build_request(_HTTP, method, endpoint, params)
+        for attempt in range(ENTREZ_MAX_RETRIES + 1):
+            _RATE_LIMITER.wait(self._rate_limit())
+            try:
+                response = _HTTP.send(request, stream=True)
+            except httpx.TransportError:
+                if attempt == ENTREZ_MAX_RETRIES:
+                    raise
+            else:
+                if response.status_code not in ENTREZ_RETRY_STATUS or attempt == ENTREZ_MAX_RETRIES:
+                    if response.is_error:
+                        response.close()
+                        response.raise_for_status()
+                    return response
+                response.close()
+            time.sleep(ENTREZ_RETRY_BACKOFF * (attempt + 1))
+
+    async def _asend(self, endpoint: str, params: Dict[str, Any], method: str = "GET") -> httpx.Response:
+        """_send的异步版本"""
+        client = _async_client()
+        request = self._build_request(client, method, endpoint, params)
+        for attempt in range(ENTREZ_MAX_RETRIES + 1):
+            await _RATE_LIMITER.await_slot(self._rate_limit())
+            try:
+                response = await client.send(request, stream=True)
+            except httpx.TransportError:
+                if attempt == ENTREZ_MAX_RETRIES:
+                    raise
+            else:
+                if response.status_code not in ENTREZ_RETRY_STATUS or attempt == ENTREZ_MAX_RETRIES:
+                    if response.is_error:
+                        await response.aclose()
+                        response.raise_for_status()
+                    return response
+                await response.aclose()
+            await asyncio.sleep(ENTREZ_RETRY_BACKOFF * (attempt + 1))
+
+    def _extract_publish_date(self, article: LET._Element) -> str:
         """提取发表时间（优先取电子出版日期，无则取印刷出版日期）"""
         # 解析PubDate节点
-        pub_date = article.find(".//Journal/JournalIssue/PubDate")
-        if not pub_date:
-            pub_date = article.find(".//ArticleDate")
-        
-        if pub_date:
-            year = pub_date.find("Year")
-            month = pub_date.find("Month")
-            day = pub_date.find("Day")
-            parts = []
-            if year is not None:
-                parts.append(year.text)
-            if month is not None:
-                parts.append(month.text)
-            if day is not None:
-                parts.append(day.text)
-            return "-".join(parts) if parts else "未知"
-        return "未知"
+        pub_date = next(iter(_XP_PUBDATE(article)), None)
+        if pub_date is None:
+            pub_date = next(iter(_XP_ARTICLE_DATE(article)), None)
+        if pub_date is None:
+            return _UNKNOWN
+        # Year/Month/Day在DTD中顺序固定，一次XPath按文档顺序取出已有的部分
+        return "-".join(_XP_YMD(pub_date)) or _UNKNOWN
 
     def _normalize_pubmed_date(self, date_text: str | None) -> str | None:
         if not date_text:
             return None
         return date_text.replace("-", "/")
 
-    def _extract_journal_name(self, article: ET.Element) -> str:
+    def _extract_journal_name(self, article: LET._Element) -> str:
         """提取期刊名称"""
-        journal = article.find(".//Journal/Title")
-        return journal.text if journal is not None else "未知"
+        return _XP_JOURNAL(article) or _UNKNOWN
 
-    def _extract_abstract_sections(self, article: ET.Element) -> Dict[str, str]:
+    def _extract_abstract_sections(self, article: LET._Element) -> Dict[str, str]:
         """提取摘要各部分（方法、结论等）"""
         abstract_sections = {}
-        abstract_texts = article.findall(".//Abstract/AbstractText")
-        
-        for section in abstract_texts:
-            label = section.get("Label", "").upper()
-            text = section.text.strip() if section.text else ""
-            if label == "METHODS":
-                abstract_sections["methods"] = text
-            elif label == "CONCLUSION":
-                abstract_sections["conclusion"] = text
-        
+        # 单次遍历：同时记录带标签的段落与全部段落文本（无METHODS标签时拼接作为方法原文）
+        parts = []
+        for section in _XP_ABSTRACT_TEXTS(article):
+            raw = section.text
+            text = raw.strip() if raw else ""
+            if raw:
+                parts.append(text)
+            key = _ABSTRACT_LABEL_MAP.get((section.get("Label") or "").upper())
+            if key:
+                abstract_sections[key] = text
+
         # 若无标签的摘要
         if not abstract_sections.get("methods"):
-            full_abstract = " ".join([t.text.strip() for t in abstract_texts if t.text])
-            abstract_sections["methods"] = full_abstract if full_abstract else "未提及"
+            abstract_sections["methods"] = " ".join(parts) or _NOT_MENTIONED
         if not abstract_sections.get("conclusion"):
-            abstract_sections["conclusion"] = "未提及"
-        
+            abstract_sections["conclusion"] = _NOT_MENTIONED
+
         return abstract_sections
 
-    def _extract_article_id(self, medline_citation: ET.Element, pubmed_article: ET.Element, id_type: str) -> str:
+    def _extract_article_id(self, medline_citation: LET._Element, pubmed_article: LET._Element, id_type: str) -> str:
         if id_type == "pmid":
-            pmid = medline_citation.find("PMID")
-            return pmid.text.strip() if pmid is not None and pmid.text else ""
+            return _XP_PMID(medline_citation).strip()
+        # IdType取值在PubMed DTD中为小写枚举（doi/pubmed/pmc...）
+        return _XP_ARTICLE_ID(pubmed_article, id_type=id_type).strip()
+
+    def _build_search_kwargs(
+        self,
+        keywords: str,
+        start_date: str | None,
+        end_date: str | None,
+        retstart: int,
+        sort: str,
+    ) -> Dict[str, Any]:
+        search_kwargs = {
+            "db": "pubmed",
+            "term": keywords,
+            "retmax": self.max_papers,
+            "retstart": max(0, retstart),
+            "sort": sort,
+        }
+        norm_start_date = self._normalize_pubmed_date(start_date)
+        norm_end_date = self._normalize_pubmed_date(end_date)
+        if norm_start_date and norm_end_date:
+            search_kwargs["datetype"] = "pdat"
+            search_kwargs["mindate"] = norm_start_date
+            search_kwargs["maxdate"] = norm_end_date
+        return search_kwargs
+
+    def _search_ids(self, search_kwargs: Dict[str, Any]) -> List[str]:
+        """检索论文ID（JSON格式返回，免去XML解析）"""
+        response = self._send("esearch.fcgi", {**search_kwargs, "retmode": "json"})
+        try:
+            return orjson.loads(response.read())["esearchresult"]["idlist"]
+        finally:
+            response.close()
 
-        for node in pubmed_article.findall(".//PubmedData/ArticleIdList/ArticleId"):
-            if node.get("IdType", "").lower() == id_type and node.text:
-                return node.text.strip()
-        return ""
+    async def _asearch_ids(self, search_kwargs: Dict[str, Any]) -> List[str]:
+        response = await self._asend("esearch.fcgi", {**search_kwargs, "retmode": "json"})
+        try:
+            return orjson.loads(await response.aread())["esearchresult"]["idlist"]
+        finally:
+            await response.aclose()
+
+    def _extract_paper(self, pubmed_article: LET._Element) -> Paper | None:
+        """解析单篇PubmedArticle节点"""
+        articles = _XP_ARTICLE(pubmed_article)
+        if not articles:
+            return None
+        article = articles[0]
+        medline_citation = article.getparent()
+
+        abstract_info = self._extract_abstract_sections(article)
+        title_text = _XP_TITLE(article).strip() or _UNKNOWN_TITLE
+
+        doi = self._extract_article_id(medline_citation, pubmed_article, "doi")
+        pmid = self._extract_article_id(medline_citation, pubmed_article, "pmid")
+
+        return Paper(
+            title=title_text,
+            publish_date=self._extract_publish_date(article),  # 发表时间
+            journal_name=self._extract_journal_name(article),  # 期刊名
+            methods_original=abstract_info["methods"],  # 研究方法原文
+            conclusion=abstract_info["conclusion"],
+            doi=doi,
+            pmid=pmid,
+            source="PubMed",
+            authors=tuple(_XP_AUTHOR_NAME(author).strip() for author in _XP_AUTHORS(article)) or _UNKNOWN_AUTHORS,
+        )
+
+    def _efetch_params(self, id_list: List[str]) -> Dict[str, Any]:
+        # efetch统一以POST提交ID列表（NCBI推荐的大批量方式），响应仍流式解析
+        return {"db": "pubmed", "id": ",".join(id_list), "rettype": "xml", "retmode": "xml"}
+
+    def _drain_articles(self, parser: LET.XMLPullParser) -> Iterator[Paper]:
+        """取出已解析完成的论文节点，处理后立即释放，内存中只保留当前一篇论文的DOM"""
+        for _, pubmed_article in parser.read_events():
+            paper = self._extract_paper(pubmed_article)
+            pubmed_article.clear()
+            while pubmed_article.getprevious() is not None:
+                del pubmed_article.getparent()[0]
+            if paper is not None:
+                yield paper
+
+    def _iter_fetch_papers(self, id_list: List[str]) -> Iterator[Paper]:
+        """获取一组PMID的论文详情，边接收响应边解析，每解析完一篇即产出"""
+        response = self._send("efetch.fcgi", self._efetch_params(id_list), method="POST")
+        try:
+            parser = LET.XMLPullParser(**_ARTICLE_PARSER_OPTIONS)
+            for chunk in response.iter_bytes():
+                parser.feed(chunk)
+                yield from self._drain_articles(parser)
+            parser.close()
+            yield from self._drain_articles(parser)
+        finally:
+            response.close()
+
+    def _fetch_papers(self, id_list: List[str]) -> List[Paper]:
+        """批量获取并解析一组PMID对应的论文详情"""
+        return list(self._iter_fetch_papers(id_list))
+
+    async def _afetch_papers(self, id_list: List[str]) -> List[Paper]:
+        response = await self._asend("efetch.fcgi", self._efetch_params(id_list), method="POST")
+        try:
+            parser = LET.XMLPullParser(**_ARTICLE_PARSER_OPTIONS)
+            papers = []
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                papers.extend(self._drain_articles(parser))
+            parser.close()
+            papers.extend(self._drain_articles(parser))
+            return papers
+        finally:
+            await response.aclose()
+
+    def _chunk_ids(self, id_list: List[str]) -> List[List[str]]:
+        return [id_list[i:i + EFETCH_BATCH_SIZE] for i in range(0, len(id_list), EFETCH_BATCH_SIZE)]
+
+    def _empty_result(self) -> Dict[str, Any]:
+        return {
+            "status": "warning",
+            "message": "未检索到文献，请调整关键词或时间范围",
+            "data": [],
+        }
+
+    def _success_result(self, keywords: str, papers: List[Paper]) -> Dict[str, Any]:
+        return {
+            "status": "success",
+            "message": f"成功检索到{len(papers)}篇论文",
+            "query": keywords,
+            "data": papers
+        }
+
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        return {
+            "status": "error",
+            "message": f"PubMed检索失败：{str(error)}，使用模拟数据",
+            # _run/_arun 返回前经_export_result深拷贝，共享的模拟数据不会被调用方修改
+            "data": list(_MOCK_PAPERS)
+        }
+
+    def _run_stream(
+        self,
+        keywords: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        retstart: int = 0,
+        sort: str = "relevance",
+    ) -> Iterator[Dict[str, Any]]:
+        """流式检索：按到达顺序逐篇产出论文字典，供可增量处理的调用方在解析完成前开始消费。
+
+        不经过结果缓存，也不返回模拟数据：检索失败时异常直接抛给调用方。
+        """
+        search_kwargs = self._build_search_kwargs(keywords, start_date, end_date, retstart, sort)
+        for id_chunk in self._chunk_ids(self._search_ids(search_kwargs)):
+            for paper in self._iter_fetch_papers(id_chunk):
+                yield paper.to_dict()
+
+    def _cache_key(self, keywords: str, start_date: str | None, end_date: str | None, retstart: int, sort: str) -> tuple:
+        return (keywords, self.max_papers, start_date, end_date, retstart, sort)
+
+    def _claim(self, key: tuple) -> tuple[Dict[str, Any] | None, Future | None]:
+        """查询缓存；未命中时返回进行中的Future，若无则登记新的Future（返回值第一项为None）"""
+        with _CACHE_LOCK:
+            cached = _RESULT_CACHE.get(key)
+            if cached is not None:
+                return cached, None
+            future = _INFLIGHT.get(key)
+            if future is not None:
+                return None, future
+            _INFLIGHT[key] = Future()
+            return None, None
+
+    def _settle(self, key: tuple, result: Dict[str, Any] | None = None, error: BaseException | None = None) -> None:
+        with _CACHE_LOCK:
+            # 失败时的模拟数据不缓存，下次检索重新请求
+            if result is not None and result["status"] in {"success", "warning"}:
+                _RESULT_CACHE[key] = result
+            future = _INFLIGHT.pop(key)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
 
     def _run(
         self,
@@ -101,109 +479,92 @@ class PubMedSearchTool(BaseTool):
         retstart: int = 0,
         sort: str = "relevance",
     ) -> Dict[str, Any]:
-        """执行PubMed检索（完善字段提取）"""
+        """执行PubMed检索（带结果缓存；缓存中保存Paper元组，返回时转换为新的字典）"""
+        key = self._cache_key(keywords, start_date, end_date, retstart, sort)
+        cached, pending = self._claim(key)
+        if cached is not None:
+            return _export_result(cached)
+        if pending is not None:
+            return _export_result(pending.result())
+        try:
+            result = self._search(keywords, start_date, end_date, retstart, sort)
+        except BaseException as e:
+            self._settle(key, error=e)
+            raise
+        self._settle(key, result)
+        return _export_result(result)
+
+    async def _arun(
+        self,
+        keywords: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        retstart: int = 0,
+        sort: str = "relevance",
+    ) -> Dict[str, Any]:
+        """异步执行PubMed检索（与_run共享结果缓存与进行中的请求）"""
+        key = self._cache_key(keywords, start_date, end_date, retstart, sort)
+        cached, pending = self._claim(key)
+        if cached is not None:
+            return _export_result(cached)
+        if pending is not None:
+            return _export_result(await asyncio.wrap_future(pending))
         try:
-            search_kwargs = {
-                "db": "pubmed",
-                "term": keywords,
-                "retmax": self.max_papers,
-                "retstart": max(0, retstart),
-                "sort": sort,
-            }
-            norm_start_date = self._normalize_pubmed_date(start_date)
-            norm_end_date = self._normalize_pubmed_date(end_date)
-            if norm_start_date and norm_end_date:
-                search_kwargs["datetype"] = "pdat"
-                search_kwargs["mindate"] = norm_start_date
-                search_kwargs["maxdate"] = norm_end_date
-
-            # 检索论文ID
-            handle = Entrez.esearch(**search_kwargs)
-            record = Entrez.read(handle)
-            handle.close()
-            id_list = record["IdList"]
+            result = await self._asearch(keywords, start_date, end_date, retstart, sort)
+        except BaseException as e:
+            self._settle(key, error=e)
+            raise
+        self._settle(key, result)
+        return _export_result(result)
 
+    def _search(
+        self,
+        keywords: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        retstart: int = 0,
+        sort: str = "relevance",
+    ) -> Dict[str, Any]:
+        """执行PubMed检索（完善字段提取）"""
+        try:
+            search_kwargs = self._build_search_kwargs(keywords, start_date, end_date, retstart, sort)
+            id_list = self._search_ids(search_kwargs)
             if not id_list:
-                return {
-                    "status": "warning",
-                    "message": "未检索到文献，请调整关键词或时间范围",
-                    "data": [],
-                }
-            
-            # 数量校验
-            # if len(id_list) < self.min_papers:
-            #     return {
-            #         "status": "warning",
-            #         "message": f"仅检索到{len(id_list)}篇论文（最少需要{self.min_papers}篇），请补充关键词或扩大检索范围",
-            #         "data": []
-            #     }
-
-            # 获取论文详情
-            handle = Entrez.efetch(
-                db="pubmed",
-                id=",".join(id_list),
-                rettype="xml",
-                retmode="text"
-            )
-            xml_data = handle.read()
-            handle.close()
-
-            # 解析论文信息（完善字段）
-            root = ET.fromstring(xml_data)
+                return self._empty_result()
+
             papers = []
-            for pubmed_article in root.findall(".//PubmedArticle"):
-                medline_citation = pubmed_article.find("MedlineCitation")
-                article = medline_citation.find("Article") if medline_citation is not None else None
-                if article is None:
-                    continue
-
-                abstract_info = self._extract_abstract_sections(article)
-                title_node = article.find("ArticleTitle")
-                title_text = "未知标题"
-                if title_node is not None:
-                    title_text = "".join(title_node.itertext()).strip() or "未知标题"
-
-                doi = self._extract_article_id(medline_citation, pubmed_article, "doi")
-                pmid = self._extract_article_id(medline_citation, pubmed_article, "pmid")
-                
-                paper = {
-                    "title": title_text,
-                    "publish_date": self._extract_publish_date(article),  # 发表时间
-                    "journal_name": self._extract_journal_name(article),  # 期刊名
-                    "methods_original": abstract_info["methods"],  # 研究方法原文
-                    "conclusion": abstract_info["conclusion"],
-                    "doi": doi,
-                    "pmid": pmid,
-                    "source": "PubMed",
-                    "authors": [
-                        f"{author.find('LastName').text} {author.find('Initials').text}" 
-                        for author in article.findall("AuthorList/Author") 
-                        if author.find("LastName") is not None
-                    ] or ["未知作者"]
-                }
-                papers.append(paper)
-
-            return {
-                "status": "success",
-                "message": f"成功检索到{len(papers)}篇论文",
-                "query": keywords,
-                "data": papers
-            }
+            for id_chunk in self._chunk_ids(id_list):
+                papers.extend(self._fetch_papers(id_chunk))
+            return self._success_result(keywords, papers)
 
         except Exception as e:
             # 异常处理
-            return {
-                "status": "error",
-                "message": f"PubMed检索失败：{str(e)}，使用模拟数据",
-                "data": [
-                    {
-                        "title": f"模拟论文{i}",
-                        "publish_date": "2024-01-01",
-                        "journal_name": "模拟期刊",
-                        "methods_original": "随机对照试验（RCT）研究，选取100例患者分为实验组和对照组",
-                        "conclusion": "模拟结论：该治疗方案有效",
-                        "authors": ["Author A"]
-                    }
-                    for i in range(10)
-                ]
-            }
\ No newline at end of file
+            return self._error_result(e)
+
+    async def _asearch(
+        self,
+        keywords: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        retstart: int = 0,
+        sort: str = "relevance",
+    ) -> Dict[str, Any]:
+        """异步执行PubMed检索：多批efetch并发请求，受Entrez速率限制约束"""
+        try:
+            search_kwargs = self._build_search_kwargs(keywords, start_date, end_date, retstart, sort)
+            id_list = await self._asearch_ids(search_kwargs)
+            if not id_list:
+                return self._empty_result()
+
+            semaphore = asyncio.Semaphore(ENTREZ_MAX_CONCURRENCY)
+
+            async def fetch(id_chunk: List[str]) -> List[Paper]:
+                async with semaphore:
+                    return await self._afetch_papers(id_chunk)
+
+            batches = await asyncio.gather(*[fetch(id_chunk) for id_chunk in self._chunk_ids(id_list)])
+            papers = [paper for batch in batches for paper in batch]
+            return self._success_result(keywords, papers)
+
+        except Exception as e:
+            return self._error_result(e)